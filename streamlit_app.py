@@ -0,0 +1,541 @@
+import functools
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+DB_PATH = "faculty_ratings.db"
+
+
+@st.cache_resource(show_spinner=False)
+def get_conn():
+    c = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=128,
+                        isolation_level=None)
+    c.row_factory = sqlite3.Row
+    c.execute("PRAGMA journal_mode=WAL")
+    c.execute("PRAGMA synchronous=NORMAL")
+    c.execute("PRAGMA busy_timeout=5000")
+    c.execute("PRAGMA temp_store=MEMORY")
+    c.execute("PRAGMA cache_size=-20000")
+    c.execute("PRAGMA mmap_size=268435456")
+    return c
+
+
+# Serializes explicit BEGIN IMMEDIATE transactions on the shared cached
+# connection; session threads would otherwise trip over each other's
+# transaction state.
+_write_lock = threading.Lock()
+
+
+def add_column_if_missing(cur, table, column, ddl):
+    cur.execute(f"PRAGMA table_info({table})")
+    existing = [row[1] for row in cur.fetchall()]
+    if column not in existing:
+        try:
+            cur.execute(f"ALTER TABLE {table} ADD COLUMN {ddl}")
+        except sqlite3.OperationalError as e:
+            # a concurrent worker may have added it first; anything else
+            # (locked table, bad DDL) must not be silently skipped
+            if "duplicate column" not in str(e):
+                raise
+
+
+SCHEMA_VERSION = 8
+
+_SELECT_FACULTY_AVG_SQL = """
+    SELECT f.id AS id, f.name AS name, f.department AS department,
+           ROUND(COALESCE(s.sum_leniency * 1.0 / s.n, 0), 1) AS avg_leniency,
+           ROUND(COALESCE(s.sum_internal / s.n, 0), 1) AS avg_internal,
+           ROUND(COALESCE(s.sum_correction * 1.0 / s.n, 0), 1) AS avg_correction,
+           ROUND(COALESCE(s.sum_teaching * 1.0 / s.n, 0), 1) AS avg_teaching,
+           COALESCE(s.n, 0) AS count
+    FROM faculty f
+    LEFT JOIN faculty_summary s ON s.faculty_id = f.id
+    ORDER BY f.name
+"""
+
+_SELECT_FACULTY_SQL = "SELECT id, name, department FROM faculty WHERE id = ?"
+
+_SELECT_RATINGS_SQL = """
+    SELECT leniency, correction, teaching, internal_from, internal_to,
+           comment, reg_no, created_at_ts
+    FROM rating
+    WHERE faculty_id = ?
+    ORDER BY created_at_ts DESC
+    LIMIT ? OFFSET ?
+"""
+
+_INSERT_FACULTY_SQL = "INSERT INTO faculty (name, department) VALUES (?, ?)"
+
+_INSERT_RATING_SQL = """
+    INSERT INTO rating (faculty_id, leniency, internal_marks, correction, comment, created_at,
+                        created_at_ts, user_email, reg_no, teaching, internal_from, internal_to)
+    VALUES (?, ?, 0, ?, ?, strftime('%Y-%m-%dT%H:%M', 'now', 'localtime'),
+            CAST(strftime('%s', 'now') AS INTEGER), ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_SUMMARY_SQL = """
+    INSERT INTO faculty_summary (faculty_id, sum_leniency, sum_correction, sum_teaching, sum_internal, n)
+    VALUES (?, ?, ?, ?, ?, 1)
+    ON CONFLICT(faculty_id) DO UPDATE SET
+        sum_leniency = sum_leniency + excluded.sum_leniency,
+        sum_correction = sum_correction + excluded.sum_correction,
+        sum_teaching = sum_teaching + excluded.sum_teaching,
+        sum_internal = sum_internal + excluded.sum_internal,
+        n = n + 1
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def init_db():
+    conn = get_conn()
+    cur = conn.cursor()
+    if cur.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+    try:
+        _migrate(cur)
+    except sqlite3.Error:
+        conn.rollback()  # no-op if BEGIN itself failed
+        raise
+
+
+def _migrate(cur):
+    cur.execute("BEGIN IMMEDIATE")
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS faculty (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            department TEXT
+        )
+        """
+    )
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS rating (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            faculty_id INTEGER NOT NULL,
+            leniency INTEGER NOT NULL,
+            internal_marks INTEGER NOT NULL,
+            correction INTEGER NOT NULL,
+            comment TEXT,
+            created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M', 'now', 'localtime')),
+            FOREIGN KEY (faculty_id) REFERENCES faculty (id)
+        )
+        """
+    )
+    add_column_if_missing(cur, "rating", "user_email", "user_email TEXT")
+    add_column_if_missing(cur, "rating", "reg_no", "reg_no TEXT")
+    add_column_if_missing(cur, "rating", "teaching", "teaching INTEGER")
+    add_column_if_missing(cur, "rating", "internal_from", "internal_from INTEGER")
+    add_column_if_missing(cur, "rating", "internal_to",
+                          "internal_to INTEGER CHECK (internal_from <= internal_to)")
+    add_column_if_missing(cur, "rating", "internal_avg",
+                          "internal_avg REAL GENERATED ALWAYS AS ((internal_from + internal_to) / 2.0) VIRTUAL")
+    add_column_if_missing(cur, "rating", "created_at_ts", "created_at_ts INTEGER")
+    cur.execute(
+        "UPDATE rating SET created_at_ts = CAST(strftime('%s', created_at, 'utc') AS INTEGER) "
+        "WHERE created_at_ts IS NULL"
+    )
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_rating_fid_ts ON rating(faculty_id, created_at_ts DESC)")
+    cur.execute("DROP INDEX IF EXISTS idx_rating_fid_created")
+    cur.execute("DROP INDEX IF EXISTS idx_rating_fid")
+    # The covering index only served the GROUP BY backfill below; averages are
+    # read from faculty_summary, so it just amplified every rating insert.
+    cur.execute("DROP INDEX IF EXISTS idx_rating_cover")
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS faculty_summary (
+            faculty_id INTEGER PRIMARY KEY,
+            sum_leniency INTEGER NOT NULL DEFAULT 0,
+            sum_correction INTEGER NOT NULL DEFAULT 0,
+            sum_teaching INTEGER NOT NULL DEFAULT 0,
+            sum_internal REAL NOT NULL DEFAULT 0,
+            n INTEGER NOT NULL DEFAULT 0,
+            FOREIGN KEY (faculty_id) REFERENCES faculty (id)
+        )
+        """
+    )
+    cur.execute("DELETE FROM faculty_summary")
+    cur.execute(
+        """
+        INSERT INTO faculty_summary (faculty_id, sum_leniency, sum_correction,
+                                     sum_teaching, sum_internal, n)
+        SELECT faculty_id,
+               SUM(COALESCE(leniency, 0)),
+               SUM(COALESCE(correction, 0)),
+               SUM(COALESCE(teaching, 0)),
+               SUM(COALESCE(internal_avg, 0)),
+               COUNT(*)
+        FROM rating
+        GROUP BY faculty_id
+        """
+    )
+    cur.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    cur.execute("COMMIT")
+
+
+def _check_query_plans(cur):
+    """Flag hot-path queries that fall back to un-indexed rating scans."""
+    checks = [
+        ("recent ratings", _SELECT_RATINGS_SQL, (1, 20, 0)),
+        ("faculty averages", _SELECT_FACULTY_AVG_SQL, ()),
+    ]
+    for label, sql, params in checks:
+        plan = cur.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        for step in plan:
+            detail = step["detail"]
+            if "SCAN rating" in detail and "USING INDEX" not in detail:
+                print(f"DEBUG_SQL: {label} is not using an index: {detail}")
+
+
+init_db()
+if os.getenv("DEBUG_SQL"):
+    _check_query_plans(get_conn().cursor())
+
+
+_EMAIL_SUFFIX = ".simats@saveetha.com"
+_EMAIL_LEN = 9 + len(_EMAIL_SUFFIX)
+
+
+def valid_college_email(email):
+    return (
+        bool(email)
+        and len(email) == _EMAIL_LEN
+        and email.endswith(_EMAIL_SUFFIX)
+        and email[:9].isdigit()
+    )
+
+
+def extract_reg_no(email):
+    if email and email.endswith(_EMAIL_SUFFIX):
+        return email[:-len(_EMAIL_SUFFIX)]
+    return None
+
+
+def _ratings_version():
+    if "ratings_version" not in st.session_state:
+        st.session_state.ratings_version = 0
+    return st.session_state.ratings_version
+
+
+def _bump_ratings_version():
+    st.session_state.ratings_version = _ratings_version() + 1
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_all_avg(version):
+    df = pd.read_sql_query(_SELECT_FACULTY_AVG_SQL, get_conn())
+    name_to_id = {f"{d.name} ({d.department})": d.id for d in df.itertuples(index=False)}
+    return df, name_to_id
+
+
+def get_all_faculty_with_avg():
+    return _fetch_all_avg(_ratings_version())[0]
+
+
+def get_faculty_name_map():
+    return _fetch_all_avg(_ratings_version())[1]
+
+
+@functools.lru_cache(maxsize=512)
+def get_faculty_by_id(fid):
+    cur = get_conn().cursor()
+    cur.execute(_SELECT_FACULTY_SQL, (fid,))
+    return cur.fetchone()
+
+
+def get_ratings_for_faculty(fid, limit=20, offset=0):
+    cur = get_conn().cursor()
+    cur.execute(_SELECT_RATINGS_SQL, (fid, limit, offset))
+    return cur.fetchall()
+
+
+def add_faculty(name, department):
+    conn = get_conn()
+    with _write_lock:
+        try:
+            cur = conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            cur.execute(_INSERT_FACULTY_SQL, (name, department))
+            cur.execute("COMMIT")
+        except sqlite3.Error:
+            conn.rollback()  # no-op if BEGIN itself failed
+            raise
+    get_faculty_by_id.cache_clear()
+    _bump_ratings_version()
+
+
+def add_faculty_many(rows):
+    """Insert (name, department) tuples in one transaction."""
+    conn = get_conn()
+    with _write_lock:
+        try:
+            cur = conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            cur.executemany(_INSERT_FACULTY_SQL, rows)
+            cur.execute("COMMIT")
+        except sqlite3.Error:
+            conn.rollback()  # no-op if BEGIN itself failed
+            raise
+    get_faculty_by_id.cache_clear()
+    _bump_ratings_version()
+
+
+def _summary_row(insert_row):
+    fid, leniency, correction = insert_row[0], insert_row[1], insert_row[2]
+    teaching, internal_from, internal_to = insert_row[6], insert_row[7], insert_row[8]
+    return (fid, leniency, correction, teaching, (internal_from + internal_to) / 2.0)
+
+
+_BATCH_MAX_ROWS = 50
+_BATCH_WAIT_S = 0.02
+
+
+@st.cache_resource(show_spinner=False)
+def _rating_writer():
+    """Queue feeding a daemon thread that commits rating inserts in batches.
+
+    Items are (row, done, errors) triples: the thread sets `done` once the
+    batch commits or rolls back, appending the exception to `errors` on
+    failure so the enqueuing caller can re-raise instead of reporting a
+    lost write as a success.
+    """
+    q = queue.Queue()
+
+    def drain():
+        wconn = sqlite3.connect(DB_PATH, cached_statements=128, isolation_level=None)
+        wconn.execute("PRAGMA journal_mode=WAL")
+        wconn.execute("PRAGMA synchronous=NORMAL")
+        wconn.execute("PRAGMA busy_timeout=5000")
+        while True:
+            batch = [q.get()]
+            deadline = time.monotonic() + _BATCH_WAIT_S
+            while len(batch) < _BATCH_MAX_ROWS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(q.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            rows = [row for row, _, _ in batch]
+            try:
+                cur = wconn.cursor()
+                cur.execute("BEGIN IMMEDIATE")
+                cur.executemany(_INSERT_RATING_SQL, rows)
+                cur.executemany(_UPSERT_SUMMARY_SQL, [_summary_row(r) for r in rows])
+                cur.execute("COMMIT")
+            except sqlite3.Error as exc:
+                wconn.rollback()
+                print(f"rating batch of {len(batch)} failed: {exc}")
+                for _, _, errors in batch:
+                    errors.append(exc)
+            finally:
+                for _, done, _ in batch:
+                    done.set()
+
+    threading.Thread(target=drain, daemon=True, name="rating-writer").start()
+    return q
+
+
+def add_rating(faculty_id, leniency, internal_from, internal_to, correction,
+               teaching, comment, user_email, reg_no):
+    row = (faculty_id, leniency, correction, comment,
+           user_email, reg_no, teaching, internal_from, internal_to)
+    done = threading.Event()
+    errors = []
+    _rating_writer().put((row, done, errors))
+    done.wait()  # wait for the batch commit so the rerun sees the new rating
+    if errors:
+        raise errors[0]
+    _bump_ratings_version()
+
+
+def add_ratings_bulk(rows):
+    """Insert many rating tuples (same column order as _INSERT_RATING_SQL) in one transaction."""
+    conn = get_conn()
+    with _write_lock:
+        try:
+            cur = conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            cur.executemany(_INSERT_RATING_SQL, rows)
+            cur.executemany(_UPSERT_SUMMARY_SQL, [_summary_row(r) for r in rows])
+            cur.execute("COMMIT")
+        except sqlite3.Error:
+            conn.rollback()  # no-op if BEGIN itself failed
+            raise
+    _bump_ratings_version()
+
+
+def page_login():
+    st.header("Login")
+    if st.session_state.get("user_email"):
+        st.success(f"Logged in as {st.session_state.user_email}")
+        st.write(f"Register number: {st.session_state.reg_no}")
+        if st.button("Log out"):
+            st.session_state.pop("user_email", None)
+            st.session_state.pop("reg_no", None)
+            st.rerun()
+    else:
+        email = st.text_input("College email", placeholder="212221040.simats@saveetha.com")
+        if st.button("Login"):
+            if valid_college_email(email):
+                st.session_state.user_email = email
+                st.session_state.reg_no = extract_reg_no(email)
+                st.rerun()
+            else:
+                st.error("Use your college email: 9-digit register number followed by .simats@saveetha.com.")
+
+
+def page_view_faculty():
+    st.header("Faculty")
+    data = get_all_faculty_with_avg()
+    if data.empty:
+        st.info("No faculty yet. Add one from the Add Faculty page.")
+        return
+    table = data.drop(columns=["id"]).rename(
+        columns={
+            "name": "Name",
+            "department": "Department",
+            "avg_leniency": "Leniency",
+            "avg_internal": "Internal",
+            "avg_correction": "Correction",
+            "avg_teaching": "Teaching",
+            "count": "Ratings",
+        }
+    )
+    st.dataframe(table, use_container_width=True, hide_index=True)
+
+
+_RATINGS_PAGE_SIZE = 20
+
+
+@st.fragment
+def rating_panel(fid):
+    with st.form("rating_form"):
+        leniency = st.slider("Leniency", 1, 5, 3)
+        correction = st.slider("Correction", 1, 5, 3)
+        teaching = st.slider("Teaching", 1, 5, 3)
+        int_from = st.number_input("Internal marks from", 0, 100, 0)
+        int_to = st.number_input("Internal marks to", 0, 100, 0)
+        comment = st.text_area("Comment (optional)")
+        submitted = st.form_submit_button("Submit rating")
+    if submitted:
+        if int_from > int_to:
+            st.error("Internal marks 'from' cannot be greater than 'to'.")
+        else:
+            try:
+                add_rating(fid, leniency, int_from, int_to, correction, teaching,
+                           comment.strip() or None,
+                           st.session_state.user_email, st.session_state.reg_no)
+            except sqlite3.Error:
+                st.error("Could not save your rating. Please try again.")
+            else:
+                # st.success would be wiped by the rerun; toasts survive it
+                st.toast("Rating submitted.", icon="✅")
+                st.rerun(scope="app")
+
+    st.subheader("Recent Ratings")
+    offset_key = f"ratings_offset_{fid}"
+    offset = st.session_state.get(offset_key, 0)
+    ratings = get_ratings_for_faculty(fid, limit=_RATINGS_PAGE_SIZE, offset=offset)
+    if not ratings:
+        st.info("No ratings yet." if offset == 0 else "No more ratings.")
+    else:
+        df = pd.DataFrame(ratings, columns=ratings[0].keys())
+        # created_at_ts is epoch UTC; render in the server's local timezone
+        # to match the localtime strings shown before the epoch column.
+        df["created_at_ts"] = (
+            pd.to_datetime(df["created_at_ts"], unit="s", utc=True)
+            .dt.tz_convert(datetime.now().astimezone().tzinfo)
+            .dt.strftime("%Y-%m-%d %H:%M")
+        )
+        df = df.rename(
+            columns={
+                "leniency": "Leniency",
+                "correction": "Correction",
+                "teaching": "Teaching",
+                "internal_from": "Internal from",
+                "internal_to": "Internal to",
+                "comment": "Comment",
+                "reg_no": "Rated by",
+                "created_at_ts": "When",
+            }
+        )
+        st.dataframe(df, use_container_width=True, hide_index=True)
+    newer, older = st.columns(2)
+    if offset > 0 and newer.button("Newer"):
+        st.session_state[offset_key] = max(0, offset - _RATINGS_PAGE_SIZE)
+        st.rerun()
+    if len(ratings) == _RATINGS_PAGE_SIZE and older.button("Older"):
+        st.session_state[offset_key] = offset + _RATINGS_PAGE_SIZE
+        st.rerun()
+
+
+def page_rate_faculty():
+    st.header("Rate Faculty")
+    if not st.session_state.get("user_email"):
+        st.warning("Login with your college email first.")
+        return
+    data = get_all_faculty_with_avg()
+    if data.empty:
+        st.info("No faculty yet. Add one from the Add Faculty page.")
+        return
+    names = get_faculty_name_map()
+    choice = st.selectbox("Faculty", list(names.keys()))
+    fid = names[choice]
+    fac = data.loc[data["id"] == fid].iloc[0]
+
+    st.subheader(fac["name"])
+    st.caption(fac["department"] or "")
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Leniency", fac["avg_leniency"])
+    c2.metric("Internal", fac["avg_internal"])
+    c3.metric("Correction", fac["avg_correction"])
+    c4.metric("Teaching", fac["avg_teaching"])
+    st.caption(f"{fac['count']} rating(s)")
+
+    rating_panel(fid)
+
+
+def page_add_faculty():
+    st.header("Add Faculty")
+    with st.form("faculty_form"):
+        name = st.text_input("Name")
+        department = st.text_input("Department")
+        submitted = st.form_submit_button("Add")
+    if submitted:
+        if not name.strip():
+            st.error("Name is required.")
+        else:
+            add_faculty(name.strip(), department.strip() or None)
+            st.success(f"Added {name.strip()}.")
+
+    st.divider()
+    st.subheader("Bulk upload")
+    uploaded = st.file_uploader("CSV with name,department columns", type="csv")
+    if uploaded is not None and st.button("Import"):
+        df = pd.read_csv(uploaded)
+        rows = list(df[["name", "department"]].itertuples(index=False, name=None))
+        add_faculty_many(rows)
+        st.success(f"Imported {len(rows)} faculty.")
+
+
+PAGES = {
+    "Login / Profile": page_login,
+    "View Faculty": page_view_faculty,
+    "Rate Faculty": page_rate_faculty,
+    "Add Faculty": page_add_faculty,
+}
+
+st.set_page_config(page_title="SSE Faculty Review", page_icon="🎓")
+st.title("🎓 SSE Faculty Review")
+
+page = st.sidebar.radio("Go to", list(PAGES))
+PAGES[page]()